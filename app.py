@@ -20,6 +20,10 @@ st.set_page_config(
 # Main page heading
 st.title("Object Detection And Tracking ")
 
+# Stop any video workers left over from a previous run; reruns that
+# don't resubmit a stream must not leave them running in the background.
+helper.cancel_pipeline_workers()
+
 # Sidebar
 st.sidebar.header("ML Model Config")
 
@@ -30,6 +34,9 @@ model_type = st.sidebar.radio(
 confidence = float(st.sidebar.slider(
     "Select Model Confidence", 25, 100, 40)) / 100
 
+use_int8 = st.sidebar.checkbox(
+    "Use INT8 TensorRT Engine (GPU only)", value=False)
+
 # Selecting Detection Or Segmentation
 if model_type == 'Detection':
     model_path = Path(settings.DETECTION_MODEL)
@@ -38,7 +45,7 @@ elif model_type == 'Segmentation':
 
 # Load Pre-trained ML Model
 try:
-    model = helper.load_model(model_path)
+    model = helper.load_model(model_path, use_int8)
 except Exception as ex:
     st.error(f"Unable to load model. Check the specified path: {model_path}")
     st.error(ex)